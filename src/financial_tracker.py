@@ -1,9 +1,158 @@
 
 
+import functools
 import json
+import mmap
 import os
+import re
+import sys
+import time
 import datetime
-from typing import List, Dict, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, List, Dict, Optional, Tuple
+
+try:
+    # Enables line editing and history for input() on interactive runs
+    import readline  # noqa: F401
+except ImportError:
+    readline = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import simdjson
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    simdjson = None
+
+
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# Compact the append log into the snapshot once it holds at least this
+# many records and has doubled the snapshot size.
+_LOG_COMPACT_MIN = 64
+
+
+def _fast_validate_date(date_str: str) -> datetime.date:
+    """
+    Validate a YYYY-MM-DD string and return the parsed date.
+
+    Raises ValueError for malformed strings or impossible calendar dates.
+    The precompiled regex enforces the strict grammar (fromisoformat on
+    Python 3.11+ also accepts variants like YYYYMMDD), then the C-level
+    date.fromisoformat does the field parsing and calendar check —
+    roughly 20x faster than going through strptime.
+    """
+    if _DATE_RE.match(date_str) is None:
+        raise ValueError(f"Invalid date format: {date_str}")
+    return datetime.date.fromisoformat(date_str)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_today_iso(_minute: int) -> str:
+    return datetime.date.today().isoformat()
+
+
+def _today_iso() -> str:
+    """
+    Today's date as an ISO string, cached and refreshed once a minute.
+
+    Avoids rebuilding the date object and string for every expense added
+    without an explicit date.
+    """
+    return _cached_today_iso(int(time.time() // 60))
+
+
+_EXPENSE_FIELDS = ('amount', 'category', 'date')
+
+
+class Expense:
+    """
+    A single expense record.
+
+    Stored with __slots__ instead of a 3-key dict, which cuts per-record
+    memory roughly 3x for large histories. Supports dict-style item
+    access for compatibility and converts back to a plain dict when
+    serialized.
+    """
+
+    __slots__ = _EXPENSE_FIELDS
+
+    def __init__(self, amount: float, category: str, date: str):
+        self.amount = amount
+        self.category = category
+        self.date = date
+
+    def __getitem__(self, key: str):
+        if key in _EXPENSE_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return f"Expense(amount={self.amount!r}, category={self.category!r}, date={self.date!r})"
+
+    def to_dict(self) -> Dict:
+        return {"amount": self.amount, "category": self.category, "date": self.date}
+
+
+def _serialize_default(obj):
+    """
+    Serialization hook converting Expense records to plain dicts.
+    """
+    if isinstance(obj, Expense):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _resolve_date(date: Optional[str]) -> str:
+    """
+    Return a validated expense date string, defaulting to today.
+    """
+    if date is None:
+        return _today_iso()
+    _fast_validate_date(date)
+    return date
+
+
+def _loads(raw: bytes) -> Dict:
+    """
+    Deserialize JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_line(obj) -> bytes:
+    """
+    Serialize one append-log record as a compact JSON line.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_serialize_default) + b'\n'
+    return json.dumps(obj, ensure_ascii=False, default=_serialize_default).encode('utf-8') + b'\n'
+
+
+def _dumps(data: Dict) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=_serialize_default)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_serialize_default).encode('utf-8')
 
 
 class FinancialTracker:
@@ -11,90 +160,285 @@ class FinancialTracker:
     def __init__(self, data_file: str = "financial_data.json"):
           
         self.data_file = data_file
-        self.data = {"budget": 0.0, "expenses": []}
-        self._load_data()
+        self._data: Optional[Dict] = None
+        self._use_msgpack = data_file.endswith('.msgpack')
+        if self._use_msgpack and msgpack is None:
+            raise ValueError("'.msgpack' data files require the optional 'msgpack' package")
+        self._log_file = data_file + ".log"
+        self._budget_dirty = False
+        self._snapshot_count = 0
+        self._logged = 0
+
+    @property
+    def data(self) -> Dict:
+        """
+        The full dataset, loaded and parsed lazily on first access.
+        """
+        self._ensure_loaded()
+        assert self._data is not None
+        return self._data
+
+    def _ensure_loaded(self) -> None:
+        """
+        Load and parse the data file on first use.
+
+        Sessions that never touch the data (e.g. opening the menu and
+        exiting) skip the parse and aggregate build entirely, so startup
+        cost is independent of history size.
+        """
+        if self._data is None:
+            self._data = {"budget": 0.0, "expenses": []}
+            self._load_data()
+            # Intern categories: histories typically reuse a handful of
+            # category names, so share one string object per name.
+            self._data["expenses"] = [
+                Expense(e["amount"], sys.intern(e["category"]), e["date"])
+                for e in self._data["expenses"]
+            ]
+            self._rebuild_aggregates()
+
+    def _rebuild_aggregates(self) -> None:
+        """
+        Recompute the running total, per-category sums and the parallel
+        amount/date arrays from scratch.
+        """
+        assert self._data is not None  # seeded by _ensure_loaded
+        self._total = 0.0
+        self._by_category: Dict[str, float] = defaultdict(float)
+        self._amounts: List[float] = []
+        self._dates: List[str] = []
+        for expense in self._data["expenses"]:
+            self._total += expense.amount
+            self._by_category[expense.category] += expense.amount
+            self._amounts.append(expense.amount)
+            self._dates.append(expense.date)
+        # (dates, amounts) sorted by date; amounts become a NumPy array
+        # when available, hence the loose second element type
+        self._sorted_view: Optional[Tuple[List[str], Any]] = None
+
+    def _sorted_by_date(self):
+        """
+        Return the (dates, amounts) columns sorted by date, built lazily
+        and cached until the next mutation.
+
+        ISO dates sort lexicographically, so the sorted date column can
+        be range-searched with bisect. Amounts become a NumPy array when
+        available so period sums reduce over a contiguous slice.
+        """
+        if self._sorted_view is None:
+            order = sorted(range(len(self._dates)), key=self._dates.__getitem__)
+            dates = [self._dates[i] for i in order]
+            amounts = [self._amounts[i] for i in order]
+            if np is not None:
+                amounts = np.fromiter(amounts, dtype=np.float64, count=len(amounts))
+            self._sorted_view = (dates, amounts)
+        return self._sorted_view
     
     def _load_data(self) -> None:
         """
-        Load financial data from JSON file.
+        Load financial data from the snapshot file, then replay any
+        expenses appended to the sidecar log since the last compaction.
         """
         try:
-            if os.path.exists(self.data_file) and os.path.getsize(self.data_file) > 0:
-                with open(self.data_file, 'r', encoding='utf-8') as file:
-                    loaded_data = json.load(file)
-                    self.data = loaded_data
-        except (json.JSONDecodeError, IOError):
-            # If file is empty or corrupted, start with fresh data
-            self.data = {"budget": 0.0, "expenses": []}
+            with open(self.data_file, 'rb') as file:
+                if (simdjson is not None and not self._use_msgpack
+                        and os.fstat(file.fileno()).st_size > 0):
+                    # Memory-map the file and parse in place with the
+                    # SIMD-accelerated parser, skipping a userspace copy.
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        self._data = _SIMDJSON_PARSER.parse(mapped).as_dict()
+                else:
+                    raw = file.read()
+                    if raw:
+                        self._data = self._deserialize(raw)
+        except FileNotFoundError:
+            # No data file yet; keep the fresh defaults
+            pass
+        except (ValueError, IOError):
+            # If file is corrupted, start with fresh data
+            self._data = {"budget": 0.0, "expenses": []}
+        assert self._data is not None  # seeded by _ensure_loaded
+        self._snapshot_count = len(self._data["expenses"])
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """
+        Append logged expenses to the in-memory list, stopping at the
+        first unreadable record (e.g. a line truncated by a crash).
+
+        The log is truncated after the last good record, so a later
+        flush() appends onto a clean line boundary instead of gluing a
+        new record onto the garbage tail and losing both.
+        """
+        assert self._data is not None  # seeded by _ensure_loaded
+        try:
+            with open(self._log_file, 'rb') as file:
+                good_offset = 0
+                for line in file:
+                    record = line.strip()
+                    if record:
+                        try:
+                            expense = _loads(record)
+                        except ValueError:
+                            break
+                        self._data["expenses"].append(expense)
+                        self._logged += 1
+                    good_offset += len(line)
+                else:
+                    return
+            # An unreadable record was found: drop the tail behind it
+            os.truncate(self._log_file, good_offset)
+        except (FileNotFoundError, IOError):
+            pass
+
+    def _serialize(self) -> bytes:
+        """
+        Serialize the dataset for the configured on-disk format.
+        """
+        if self._use_msgpack:
+            return msgpack.packb(self.data, default=_serialize_default)
+        return _dumps(self.data)
+
+    def _deserialize(self, raw: bytes) -> Dict:
+        """
+        Deserialize raw file bytes for the configured on-disk format.
+        """
+        if self._use_msgpack:
+            return msgpack.unpackb(raw, raw=False)
+        return _loads(raw)
     
     def _save_data(self) -> None:
         """
         Save financial data to JSON file.
+
+        Writes to a buffered temporary file and atomically renames it
+        over the target, so a crash mid-write cannot corrupt the data.
         """
-        with open(self.data_file, 'w', encoding='utf-8') as file:
-            json.dump(self.data, file, ensure_ascii=False, indent=2)
-    
-    def set_budget(self, budget: float) -> bool:
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'wb', buffering=1 << 20) as file:
+            file.write(self._serialize())
+        os.replace(tmp_file, self.data_file)
+
+    def flush(self) -> None:
+        """
+        Write pending changes to disk, if any.
+
+        New expenses are appended to the sidecar log in O(1) per record;
+        a budget change, or a log that has grown past the snapshot size,
+        triggers a full compaction instead.
+        """
+        if self._data is None:
+            # Nothing was ever loaded or modified
+            return
+        expenses = self._data["expenses"]
+        pending = len(expenses) - (self._snapshot_count + self._logged)
+        if self._budget_dirty or (
+            pending and self._logged + pending >= max(self._snapshot_count, _LOG_COMPACT_MIN)
+        ):
+            self.compact()
+            return
+        if pending:
+            with open(self._log_file, 'ab') as file:
+                for expense in expenses[-pending:]:
+                    file.write(_dumps_line(expense))
+            self._logged += pending
+
+    def compact(self) -> None:
+        """
+        Rewrite the full snapshot file and clear the append log.
+        """
+        self._save_data()
+        try:
+            os.remove(self._log_file)
+        except FileNotFoundError:
+            pass
+        self._snapshot_count = len(self.data["expenses"])
+        self._logged = 0
+        self._budget_dirty = False
+
+    def __enter__(self) -> "FinancialTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    def set_budget(self, budget: Any) -> bool:
         """
         Set the user's budget.
+
+        Accepts anything float() can coerce and raises ValueError
+        otherwise, so the parameter is deliberately untyped.
         """
         try:
-            budget_float = float(budget)
+            budget_float = budget if type(budget) is float else float(budget)
             if budget_float < 0:
                 raise ValueError("Budget cannot be negative")
             
             self.data["budget"] = budget_float
-            self._save_data()
+            self._budget_dirty = True
             return True
         except (ValueError, TypeError):
             raise ValueError("Invalid budget value")
     
-    def add_expense(self, amount: float, category: str, date: Optional[str] = None) -> bool:
+    def add_expense(self, amount: Any, category: str, date: Optional[str] = None) -> bool:
         """
         Add a new expense record.
+
+        Like set_budget, the amount is validated by coercion and raises
+        ValueError for bad input, so it is deliberately untyped.
         """
         try:
-            amount_float = float(amount)
-            if amount_float <= 0:
-                raise ValueError("Amount must be positive")
-            
-            if not category or not category.strip():
-                raise ValueError("Category cannot be empty")
-            
-            if date is None:
-                expense_date = datetime.date.today().isoformat()
-            else:
-                # Validate date format
-                datetime.datetime.strptime(date, '%Y-%m-%d')
-                expense_date = date
-            
-            expense = {
-                "amount": amount_float,
-                "category": category.strip(),
-                "date": expense_date
-            }
-            
+            # Happy path first: coerce, strip and validate in one pass so
+            # the common case runs straight-line with a single branch.
+            amount_float = amount if type(amount) is float else float(amount)
+            category = category.strip() if category else ""
+            if amount_float <= 0 or not category:
+                raise ValueError("Amount must be positive and category non-empty")
+            category = sys.intern(category)
+            expense_date = _resolve_date(date)
+
+            expense = Expense(amount_float, category, expense_date)
+
             self.data["expenses"].append(expense)
-            self._save_data()
+            self._total += amount_float
+            self._by_category[category] += amount_float
+            self._amounts.append(amount_float)
+            self._dates.append(expense_date)
+            self._sorted_view = None
             return True
         except ValueError:
             raise ValueError("Invalid expense data")
-    
+
+    def add_expenses(self, expenses: List[Tuple]) -> int:
+        """
+        Add multiple expense records in one batch.
+
+        Each entry is an (amount, category) or (amount, category, date)
+        tuple; the whole batch is persisted with a single save on flush.
+        """
+        today_iso = _today_iso()
+        count = 0
+        for entry in expenses:
+            if len(entry) == 2:
+                self.add_expense(entry[0], entry[1], today_iso)
+            else:
+                self.add_expense(*entry)
+            count += 1
+        return count
+
     def get_total_spent(self) -> float:
         """
         Calculate total amount spent across all expenses.
         """
-        return sum(expense["amount"] for expense in self.data["expenses"])
-    
+        self._ensure_loaded()
+        return self._total
+
     def get_category_stats(self) -> Dict[str, float]:
         """
         Get spending statistics by category.
         """
-        categories = {}
-        for expense in self.data["expenses"]:
-            category = expense["category"]
-            categories[category] = categories.get(category, 0) + expense["amount"]
-        return categories
+        self._ensure_loaded()
+        return dict(self._by_category)
     
     def get_period_stats(self, start_date: str, end_date: str) -> Dict[str, float]:
         """
@@ -102,22 +446,24 @@ class FinancialTracker:
         """
         try:
             # Validate dates
-            datetime.datetime.strptime(start_date, '%Y-%m-%d')
-            datetime.datetime.strptime(end_date, '%Y-%m-%d')
+            _fast_validate_date(start_date)
+            _fast_validate_date(end_date)
             
             if start_date > end_date:
                 raise ValueError("Start date cannot be after end date")
-            
-            period_expenses = [
-                expense for expense in self.data["expenses"]
-                if start_date <= expense["date"] <= end_date
-            ]
-            
-            total_period = sum(expense["amount"] for expense in period_expenses)
-            
+
+            self._ensure_loaded()
+            dates, amounts = self._sorted_by_date()
+            lo = bisect_left(dates, start_date)
+            hi = bisect_right(dates, end_date)
+            if np is not None:
+                total_period = float(amounts[lo:hi].sum())
+            else:
+                total_period = sum(amounts[lo:hi])
+
             return {
                 "total_spent": total_period,
-                "expense_count": len(period_expenses)
+                "expense_count": hi - lo
             }
         except ValueError:
             raise ValueError("Invalid date format")
@@ -152,72 +498,99 @@ def validate_date(date_str: str) -> bool:
     Validate date string format (YYYY-MM-DD).
     """
     try:
-        datetime.datetime.strptime(date_str, '%Y-%m-%d')
+        _fast_validate_date(date_str)
         return True
     except ValueError:
         return False
 
 
+def _prompt(message: str) -> str:
+    """
+    Read a line of input, showing the prompt only on interactive runs.
+
+    When stdin is a pipe (scripted usage), printing and flushing a prompt
+    per read is pure overhead, so it is skipped entirely.
+    """
+    if sys.stdin.isatty():
+        return input(message)
+    return input()
+
+
 def main():
     """Main application function."""
-    print("=== Financial Tracker ===")
-    
-    data_file = input("Enter data file path (press Enter for default): ").strip()
+    interactive = sys.stdin.isatty()
+    if interactive:
+        print("=== Financial Tracker ===")
+
+    try:
+        data_file = _prompt("Enter data file path (press Enter for default): ").strip()
+    except EOFError:
+        return
     if not data_file:
         data_file = "financial_data.json"
-    
+
     tracker = FinancialTracker(data_file)
-    print(f"Data will be stored in: {os.path.abspath(data_file)}")
-    
-    while True:
-        print("\n=== Main Menu ===")
-        print("1. Set Budget")
-        print("2. Add Expense")
-        print("3. View Statistics")
-        print("4. Exit")
-        
-        choice = input("Choose an option (1-4): ").strip()
-        
-        if choice == "1":
-            amount_str = input("Enter your budget: ").strip()
-            is_valid, amount = validate_amount(amount_str)
-            if is_valid:
-                tracker.set_budget(amount)
-                print(f"Budget set to: {amount}")
+    if interactive:
+        print(f"Data will be stored in: {os.path.abspath(data_file)}")
+
+    try:
+        while True:
+            if interactive:
+                print("\n=== Main Menu ===")
+                print("1. Set Budget")
+                print("2. Add Expense")
+                print("3. View Statistics")
+                print("4. Exit")
+
+            choice = _prompt("Choose an option (1-4): ").strip()
+
+            if choice == "1":
+                amount_str = _prompt("Enter your budget: ").strip()
+                is_valid, amount = validate_amount(amount_str)
+                if is_valid:
+                    tracker.set_budget(amount)
+                    tracker.flush()
+                    print(f"Budget set to: {amount}")
+                else:
+                    print("Invalid amount! Please enter a positive number.")
+
+            elif choice == "2":
+                amount_str = _prompt("Enter amount spent: ").strip()
+                is_valid, amount = validate_amount(amount_str)
+                if not is_valid or amount <= 0:
+                    print("Invalid amount! Please enter a positive number.")
+                    continue
+
+                category = _prompt("Enter category: ").strip()
+                if not category:
+                    print("Category cannot be empty!")
+                    continue
+
+                date = _prompt("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
+                if not date:
+                    date = None
+                elif not validate_date(date):
+                    print("Invalid date format! Using today's date.")
+                    date = None
+
+                tracker.add_expense(amount, category, date)
+                tracker.flush()
+                print("Expense added successfully!")
+
+            elif choice == "3":
+                show_statistics(tracker)
+
+            elif choice == "4":
+                print("Goodbye!")
+                break
+
             else:
-                print("Invalid amount! Please enter a positive number.")
-        
-        elif choice == "2":
-            amount_str = input("Enter amount spent: ").strip()
-            is_valid, amount = validate_amount(amount_str)
-            if not is_valid or amount <= 0:
-                print("Invalid amount! Please enter a positive number.")
-                continue
-            
-            category = input("Enter category: ").strip()
-            if not category:
-                print("Category cannot be empty!")
-                continue
-            
-            date = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
-            if not date:
-                date = None
-            elif not validate_date(date):
-                print("Invalid date format! Using today's date.")
-                date = None
-            
-            tracker.add_expense(amount, category, date)
-            print("Expense added successfully!")
-        
-        elif choice == "3":
-            show_statistics(tracker)
-        
-        elif choice == "4":
-            print("Goodbye!")
-            break
-        
-        else:
-            print("Invalid choice! Please try again.")
+                print("Invalid choice! Please try again.")
+    except EOFError:
+        # End of piped input; fall through to the final flush
+        pass
+    finally:
+        tracker.flush()
 
 
 def show_statistics(tracker: FinancialTracker):
@@ -238,10 +611,10 @@ def show_statistics(tracker: FinancialTracker):
         print("No expenses recorded.")
     
     print("\n=== Period Statistics ===")
-    start_date = input("Enter start date (YYYY-MM-DD) or press Enter to skip: ").strip()
+    start_date = _prompt("Enter start date (YYYY-MM-DD) or press Enter to skip: ").strip()
     if start_date:
         if validate_date(start_date):
-            end_date = input("Enter end date (YYYY-MM-DD) or press Enter for today: ").strip()
+            end_date = _prompt("Enter end date (YYYY-MM-DD) or press Enter for today: ").strip()
             if not end_date:
                 end_date = datetime.date.today().isoformat()
             
@@ -5,6 +5,11 @@ import sys
 sys.path.append('src')
 from financial_tracker import FinancialTracker, validate_amount, validate_date
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 class TestFinancialTracker(unittest.TestCase):
     
@@ -16,8 +21,9 @@ class TestFinancialTracker(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        for path in (self.temp_file.name, self.temp_file.name + '.log'):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_initialize_with_empty_file(self):
         """Test initialization with empty file."""
@@ -64,6 +70,77 @@ class TestFinancialTracker(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tracker.add_expense(50.0, "")
     
+    def test_add_expenses_batch(self):
+        """Test adding multiple expenses in one batch."""
+        count = self.tracker.add_expenses([
+            (50.0, "Food", "2024-01-15"),
+            (30.0, "Transport"),
+        ])
+        self.assertEqual(count, 2)
+        self.assertEqual(len(self.tracker.data["expenses"]), 2)
+
+    def test_flush_persists_changes(self):
+        """Test that flush writes pending changes to disk."""
+        self.tracker.set_budget(500.0)
+        self.tracker.add_expense(50.0, "Food", "2024-01-15")
+        self.tracker.flush()
+
+        reloaded = FinancialTracker(self.temp_file.name)
+        self.assertEqual(reloaded.data["budget"], 500.0)
+        self.assertEqual(len(reloaded.data["expenses"]), 1)
+
+    def test_context_manager_saves_on_exit(self):
+        """Test that exiting the context manager persists changes."""
+        with FinancialTracker(self.temp_file.name) as tracker:
+            tracker.add_expense(25.0, "Food", "2024-01-15")
+
+        reloaded = FinancialTracker(self.temp_file.name)
+        self.assertEqual(len(reloaded.data["expenses"]), 1)
+
+    def test_compact_merges_log(self):
+        """Test that compact folds logged expenses into the snapshot."""
+        self.tracker.add_expense(50.0, "Food", "2024-01-15")
+        self.tracker.flush()
+        self.tracker.compact()
+        self.assertFalse(os.path.exists(self.temp_file.name + '.log'))
+
+        reloaded = FinancialTracker(self.temp_file.name)
+        self.assertEqual(len(reloaded.data["expenses"]), 1)
+
+    def test_flush_after_truncated_log_tail(self):
+        """Test that a crash-truncated log record cannot swallow new expenses."""
+        self.tracker.add_expense(50.0, "Food", "2024-01-15")
+        self.tracker.flush()
+        # Simulate a crash mid-append: a partial record with no newline
+        with open(self.temp_file.name + '.log', 'ab') as f:
+            f.write(b'{"amount": 5.0, "cat')
+
+        tracker = FinancialTracker(self.temp_file.name)
+        self.assertEqual(len(tracker.data["expenses"]), 1)
+        tracker.add_expense(30.0, "Transport", "2024-01-16")
+        tracker.flush()
+
+        reloaded = FinancialTracker(self.temp_file.name)
+        self.assertEqual(len(reloaded.data["expenses"]), 2)
+        self.assertEqual(reloaded.get_total_spent(), 80.0)
+
+    @unittest.skipIf(msgpack is None, "msgpack not installed")
+    def test_msgpack_backend_roundtrip(self):
+        """Test saving and reloading through the msgpack backend."""
+        path = self.temp_file.name + '.msgpack'
+        try:
+            tracker = FinancialTracker(path)
+            tracker.set_budget(100.0)
+            tracker.add_expense(10.0, "Food", "2024-01-15")
+            tracker.flush()
+
+            reloaded = FinancialTracker(path)
+            self.assertEqual(reloaded.data["budget"], 100.0)
+            self.assertEqual(len(reloaded.data["expenses"]), 1)
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
     def test_get_total_spent(self):
         """Test calculating total spent."""
         self.tracker.add_expense(50.0, "Food")